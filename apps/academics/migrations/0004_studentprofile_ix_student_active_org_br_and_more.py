@@ -0,0 +1,22 @@
+# Generated by Django 5.2.11 on 2026-10-16 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0003_remove_batch_days_of_week_batchscheduleday'),
+        ('orgs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='studentprofile',
+            index=models.Index(condition=models.Q(('is_active_for_login', True)), fields=['organisation', 'branch'], name='ix_student_active_org_br'),
+        ),
+        migrations.AddIndex(
+            model_name='teacherprofile',
+            index=models.Index(condition=models.Q(('is_active_for_login', True)), fields=['organisation', 'branch'], name='ix_teacher_active_org_br'),
+        ),
+    ]
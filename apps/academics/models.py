@@ -87,6 +87,8 @@ class TeacherProfile(TimeStampedModel):
         indexes = [
             models.Index(fields=["branch", "is_active_for_login"]),
             models.Index(fields=["organisation", "branch"]),
+            # Active-seat counts (subscription usage) → index-only scan
+            models.Index(fields=["organisation", "branch"], condition=models.Q(is_active_for_login=True), name="ix_teacher_active_org_br"),
         ]
 
     def save(self, *args, **kwargs):
@@ -116,6 +118,8 @@ class StudentProfile(TimeStampedModel):
         indexes = [
             models.Index(fields=["branch", "is_active_for_login"]),
             models.Index(fields=["organisation", "branch"]),
+            # Active-seat counts (subscription usage) → index-only scan
+            models.Index(fields=["organisation", "branch"], condition=models.Q(is_active_for_login=True), name="ix_student_active_org_br"),
         ]
 
     def save(self, *args, **kwargs):
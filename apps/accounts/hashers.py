@@ -0,0 +1,15 @@
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id at OWASP's single-lane profile (m=46 MiB, t=1, p=1).
+
+    Django's defaults (m=100 MiB, t=2, p=8) oversubscribe small containers on
+    every login. The algorithm name is unchanged, so existing hashes still
+    verify and are re-hashed with these parameters on next login.
+    """
+
+    time_cost = 1
+    memory_cost = 47104
+    parallelism = 1
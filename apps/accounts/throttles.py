@@ -1,23 +1,33 @@
-from rest_framework.throttling import SimpleRateThrottle
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS
+from django.core.cache import caches
+from rest_framework.throttling import AnonRateThrottle
+from rest_framework.throttling import ScopedRateThrottle
+from rest_framework.throttling import UserRateThrottle
 
-class LoginRateThrottle(SimpleRateThrottle):
-    scope = "login"
+# Dedicated cache for throttle histories (own Redis pool in production);
+# settings without it fall back to the default cache.
+THROTTLE_CACHE_ALIAS = "throttle"
 
-    def get_cache_key(self, request, view):
-        # Throttle by IP for anonymous login attempts
-        ip = self.get_ident(request)
-        return f"throttle_login_{ip}"
 
-class BranchJoinRateThrottle(SimpleRateThrottle):
-    scope = "branch_join"
+class ThrottleCacheMixin:
+    @property
+    def cache(self):
+        if THROTTLE_CACHE_ALIAS in settings.CACHES:
+            return caches[THROTTLE_CACHE_ALIAS]
+        return caches[DEFAULT_CACHE_ALIAS]
 
-    def get_cache_key(self, request, view):
-        ip = self.get_ident(request)
-        return f"throttle_branch_join_{ip}"
 
-class OrgSignupRateThrottle(SimpleRateThrottle):
-    scope = "org_signup"
+class AnonThrottle(ThrottleCacheMixin, AnonRateThrottle):
+    pass
 
-    def get_cache_key(self, request, view):
-        ip = self.get_ident(request)
-        return f"throttle_org_signup_{ip}"
\ No newline at end of file
+
+class UserThrottle(ThrottleCacheMixin, UserRateThrottle):
+    pass
+
+
+class ScopedThrottle(ThrottleCacheMixin, ScopedRateThrottle):
+    """
+    Rate from DEFAULT_THROTTLE_RATES[view.throttle_scope]; views without a
+    throttle_scope are not throttled. Anonymous requests are keyed by IP.
+    """
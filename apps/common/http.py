@@ -0,0 +1,28 @@
+"""
+apps/common/http.py
+
+Conditional-GET helpers for polled endpoints.
+
+    etag = weak_etag(obj.pk, obj.updated_at.timestamp())
+    if etag_matches(request, etag):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+"""
+from __future__ import annotations
+
+from django.utils.http import parse_etags
+
+
+def weak_etag(*parts) -> str:
+    return 'W/"' + "-".join(str(p) for p in parts) + '"'
+
+
+def etag_matches(request, etag: str) -> bool:
+    """Weak comparison of `etag` against the request's If-None-Match header."""
+    header = request.META.get("HTTP_IF_NONE_MATCH")
+    if not header:
+        return False
+    tags = parse_etags(header)
+    if "*" in tags:
+        return True
+    target = etag.removeprefix("W/")
+    return any(tag.removeprefix("W/") == target for tag in tags)
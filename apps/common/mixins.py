@@ -7,6 +7,7 @@ Every app imports from here — never duplicating tenant-scoping logic.
 Class hierarchy
 ───────────────
 StandardPagination
+CreatedAtCursorPagination   → keyset pagination for large, append-mostly lists
 TenantMixin                 → resolves & caches (org, branch) from headers
   TenantFilterMixin         → scopes get_queryset() to org + branch
   TenantCreateMixin         → injects org+branch (+ optional created_by) on save
@@ -27,7 +28,7 @@ from __future__ import annotations
 from django.db.models import Q
 from rest_framework import status
 from rest_framework.decorators import action
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
@@ -50,6 +51,21 @@ class StandardPagination(PageNumberPagination):
     max_page_size = 200
 
 
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    Keyset pagination on -created_at, 50 per page (client max 200).
+    Each page is a bounded `WHERE created_at < cursor LIMIT n` query, so deep
+    pages cost the same as the first (no OFFSET scan) and memory stays flat.
+
+    Response envelope:
+        { "next": "…?cursor=…", "previous": "…?cursor=…", "results": [...] }
+    """
+    ordering = "-created_at"
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Tenant resolution
 # ─────────────────────────────────────────────────────────────────────────────
@@ -230,9 +246,14 @@ class ApproveRejectMixin:
         _do_reject(self, request, obj)  -> dict
 
     Both should raise serializers.ValidationError on business-rule failure.
+
+    Set `approve_reject_fetch_object = False` when the hooks write by
+    self.kwargs["pk"] themselves; `obj` is then None and the get_object()
+    SELECT is skipped.
     """
     approve_permission_classes: list = []
     reject_permission_classes: list = []
+    approve_reject_fetch_object: bool = True
 
     def _get_action_permissions(self, action_name: str):
         if action_name == "approve" and self.approve_permission_classes:
@@ -246,7 +267,7 @@ class ApproveRejectMixin:
         for perm in self._get_action_permissions("approve"):
             if not perm.has_permission(request, self):
                 return Response({"detail": "Permission denied."}, status=status.HTTP_403_FORBIDDEN)
-        obj = self.get_object()
+        obj = self.get_object() if self.approve_reject_fetch_object else None
         result = self._do_approve(request, obj)
         return Response(result, status=status.HTTP_200_OK)
 
@@ -255,7 +276,7 @@ class ApproveRejectMixin:
         for perm in self._get_action_permissions("reject"):
             if not perm.has_permission(request, self):
                 return Response({"detail": "Permission denied."}, status=status.HTTP_403_FORBIDDEN)
-        obj = self.get_object()
+        obj = self.get_object() if self.approve_reject_fetch_object else None
         result = self._do_reject(request, obj)
         return Response(result, status=status.HTTP_200_OK)
 
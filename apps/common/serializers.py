@@ -0,0 +1,30 @@
+"""
+apps/common/serializers.py
+
+Shared serializer building blocks.
+
+SerializerCacheMixin
+────────────────────
+DRF rebuilds `_readable_fields` / `_writable_fields` as generators on every
+to_representation() / to_internal_value() call, i.e. once per row in list
+endpoints. The bound field set never changes after `.fields` is built, so the
+mixin materialises both lists once per serializer instance. ListSerializer
+reuses a single child instance, so the cost is paid once per response.
+
+Usage:
+    class PlanSerializer(SerializerCacheMixin, serializers.ModelSerializer):
+        ...
+"""
+from __future__ import annotations
+
+from django.utils.functional import cached_property
+
+
+class SerializerCacheMixin:
+    @cached_property
+    def _readable_fields(self):
+        return [field for field in self.fields.values() if not field.write_only]
+
+    @cached_property
+    def _writable_fields(self):
+        return [field for field in self.fields.values() if not field.read_only]
@@ -16,6 +16,16 @@ class TenantContext:
 
 
 def get_tenant_context(request) -> TenantContext:
+    """
+    Request-scoped TenantContext: resolved once, then memoized on the request
+    so permission classes, get_queryset() and perform_create() share it.
+    """
+    if not hasattr(request, "_tenant_ctx"):
+        request._tenant_ctx = _resolve_tenant_context(request)
+    return request._tenant_ctx
+
+
+def _resolve_tenant_context(request) -> TenantContext:
     """
     Resolve current org/branch from headers (recommended) and verify membership.
 
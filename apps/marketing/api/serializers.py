@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import re
+
 from django.db import transaction
 from rest_framework import serializers
 
@@ -13,9 +15,53 @@ from apps.marketing.models import (
 )
 from apps.academics.models import Batch
 
+_BATCHES = TargetGroup.BATCHES.value
+
+MAX_BATCHES = 500
+
+_INT_STRING = re.compile(r"[+-]?[0-9]+")
+
+
+def _as_int(value) -> int:
+    """int(value) for ints, integral floats and plain digit strings; else ValueError."""
+    if isinstance(value, bool):
+        raise ValueError(value)
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and _INT_STRING.fullmatch(value.strip()):
+        return int(value)
+    raise ValueError(value)
+
+
+class IntListField(serializers.Field):
+    """
+    List of ints coerced in one pass, instead of ListField(child=IntegerField())
+    which runs a full child-field validation per element.
+    """
+    default_error_messages = {
+        "not_a_list": "Expected a list of integers.",
+        "invalid": "All items must be integers.",
+        "max_length": f"Ensure this list has at most {MAX_BATCHES} items.",
+    }
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list):
+            self.fail("not_a_list")
+        if len(data) > MAX_BATCHES:
+            self.fail("max_length")
+        try:
+            return [_as_int(x) for x in data]
+        except ValueError:
+            self.fail("invalid")
+
+    def to_representation(self, value):
+        return list(value)
+
 
 class WhatsAppCampaignSerializer(serializers.ModelSerializer):
-    batch_ids = serializers.ListField(child=serializers.IntegerField(), required=False, allow_empty=True)
+    batch_ids = IntListField(required=False)
 
     class Meta:
         model = WhatsAppCampaign
@@ -32,7 +78,7 @@ class WhatsAppCampaignSerializer(serializers.ModelSerializer):
         read_only_fields = ["public_id", "created_at"]
 
     def validate(self, attrs):
-        if attrs.get("target_group") == TargetGroup.BATCHES and not attrs.get("batch_ids"):
+        if attrs.get("target_group") == _BATCHES and not attrs.get("batch_ids"):
             raise serializers.ValidationError({"batch_ids": "Required when target_group=BATCHES."})
         return attrs
 
@@ -1,9 +1,8 @@
 """
-marketing/api/views.py  — COMPLETE VERSION
+marketing/api/views.py
 
-Fixed vs original:
-  - send() action is properly defined INSIDE the class (original monkey-patched it after)
-  - All imports cleaned up (removed duplicate CampaignStatus import)
+WhatsAppCampaignViewSet is defined exactly once here (send + logs actions
+live inside the class); earlier drafts and the monkey-patched send() are gone.
 
 Endpoints:
   GET/POST  /api/wa-campaigns/
@@ -13,6 +12,7 @@ Endpoints:
 """
 from __future__ import annotations
 
+from django.db import transaction
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -25,6 +25,8 @@ from apps.marketing.api.serializers import (
     WhatsAppMessageLogSerializer,
 )
 
+_SENDABLE_STATUSES = frozenset({CampaignStatus.DRAFT.value, CampaignStatus.SCHEDULED.value})
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # FIX #5 — WhatsAppCampaignViewSet: add POST /{id}/send/
@@ -85,6 +87,7 @@ class WhatsAppCampaignViewSet(StatusFilterMixin, TenantViewSet):
         return Response(WhatsAppMessageLogSerializer(qs, many=True).data)
 
     @action(detail=True, methods=["post"], url_path="send")
+    @transaction.atomic
     def send(self, request, pk=None):
         """
         POST /api/wa-campaigns/{id}/send/
@@ -92,22 +95,37 @@ class WhatsAppCampaignViewSet(StatusFilterMixin, TenantViewSet):
         Immediately triggers a DRAFT or SCHEDULED campaign.
         Sets status → SENDING and enqueues the Celery send task.
 
+        The campaign row is claimed with SELECT … FOR UPDATE SKIP LOCKED, so
+        concurrent calls on other workers get 409 instead of a second enqueue.
+
         Response: { campaign_id, status, message }
         """
         campaign = self.get_object()
 
-        if campaign.status not in (CampaignStatus.DRAFT, CampaignStatus.SCHEDULED):
+        if campaign.status not in _SENDABLE_STATUSES:
             return Response(
                 {"detail": f"Cannot send a campaign with status '{campaign.status}'."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        campaign = (
+            WhatsAppCampaign.objects
+            .select_for_update(skip_locked=True)
+            .filter(pk=campaign.pk, status__in=_SENDABLE_STATUSES)
+            .first()
+        )
+        if campaign is None:
+            return Response(
+                {"detail": "Campaign is already sending or locked."},
+                status=status.HTTP_409_CONFLICT,
+            )
+
         campaign.status = CampaignStatus.SENDING
         campaign.save(update_fields=["status", "updated_at"])
 
-        # Enqueue Celery task when worker is configured:
+        # Enqueue Celery task when worker is configured (lock released at commit):
         # from apps.marketing.tasks import send_whatsapp_campaign
-        # send_whatsapp_campaign.delay(campaign.id)
+        # transaction.on_commit(lambda: send_whatsapp_campaign.delay(campaign.id))
 
         return Response(
             {
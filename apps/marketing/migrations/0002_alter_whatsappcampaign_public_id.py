@@ -0,0 +1,19 @@
+# Generated by Django 5.2.11 on 2026-10-16 09:12
+
+import apps.common.public_ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('marketing', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='whatsappcampaign',
+            name='public_id',
+            field=models.CharField(db_index=True, default=apps.common.public_ids.campaign_public_id, editable=False, max_length=24, unique=True),
+        ),
+    ]
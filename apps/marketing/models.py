@@ -24,7 +24,7 @@ class TargetGroup(models.TextChoices):
 
 class WhatsAppCampaign(TimeStampedModel):
     id = models.BigAutoField(primary_key=True)
-    public_id = models.CharField(max_length=24, unique=True, db_index=True, editable=False)
+    public_id = models.CharField(max_length=24, unique=True, db_index=True, editable=False, default=campaign_public_id)
 
     organisation = models.ForeignKey("orgs.Organisation", on_delete=models.CASCADE, related_name="wa_campaigns")
     branch = models.ForeignKey("orgs.Branch", on_delete=models.CASCADE, related_name="wa_campaigns")
@@ -45,11 +45,6 @@ class WhatsAppCampaign(TimeStampedModel):
             models.Index(fields=["organisation", "status", "scheduled_at"]),
         ]
 
-    def save(self, *args, **kwargs):
-        if not self.public_id:
-            self.public_id = campaign_public_id()
-        super().save(*args, **kwargs)
-
 
 class WhatsAppCampaignBatchTarget(TimeStampedModel):
     id = models.BigAutoField(primary_key=True)
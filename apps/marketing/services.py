@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+from django.utils import timezone
+
+from apps.marketing.models import DeliveryStatus, WhatsAppMessageLog
+
+_DELIVERY_STATUSES = frozenset(DeliveryStatus.values)
+
+
+def bulk_update_status(pairs: Iterable[tuple[str, str]]) -> int:
+    """
+    Apply provider delivery callbacks in bulk.
+
+    `pairs` is an iterable of (provider_message_id, status). Callbacks are
+    bucketed by status and written with one UPDATE per bucket, so a webhook
+    burst costs at most len(DeliveryStatus) queries instead of one per message.
+    The last status seen for a message wins; unknown statuses are ignored.
+    Returns the number of rows updated.
+    """
+    latest: dict[str, str] = {}
+    for provider_message_id, new_status in pairs:
+        if provider_message_id and new_status in _DELIVERY_STATUSES:
+            latest[provider_message_id] = new_status
+
+    buckets: dict[str, list[str]] = defaultdict(list)
+    for provider_message_id, new_status in latest.items():
+        buckets[new_status].append(provider_message_id)
+
+    now = timezone.now()
+    updated = 0
+    for new_status, ids in buckets.items():
+        updated += (
+            WhatsAppMessageLog.objects
+            .filter(provider_message_id__in=ids)
+            .update(status=new_status, updated_at=now)
+        )
+    return updated
@@ -3,6 +3,20 @@ from rest_framework.permissions import BasePermission
 from apps.orgs.models import Organisation
 
 
+def get_owner_org(request) -> Organisation | None:
+    """
+    Organisation owned by request.user (matched on owner_mobile).
+    Memoized on the request so permission checks and view code share one query.
+    """
+    if not hasattr(request, "_owner_org"):
+        # user field name assumed: mobile
+        mobile = getattr(request.user, "mobile", None)
+        request._owner_org = (
+            Organisation.objects.filter(owner_mobile=mobile).first() if mobile else None
+        )
+    return request._owner_org
+
+
 class IsOrgOwnerByMobile(BasePermission):
     """
     Temporary: org owner = Organisation.owner_mobile == request.user.mobile
@@ -12,10 +26,4 @@ class IsOrgOwnerByMobile(BasePermission):
         if not request.user or not request.user.is_authenticated:
             return False
 
-        # user field name assumed: mobile
-        mobile = getattr(request.user, "mobile", None)
-        if not mobile:
-            return False
-
-        org = Organisation.objects.filter(owner_mobile=mobile).first()
-        return org is not None
\ No newline at end of file
+        return get_owner_org(request) is not None
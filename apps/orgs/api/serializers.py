@@ -19,6 +19,15 @@ class OrganisationSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["public_id", "created_at", "updated_at", "status"]
 
+    def update(self, instance, validated_data):
+        # Only plain columns are writable here, so UPDATE just the touched ones.
+        if not validated_data:
+            return instance
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, "updated_at"])
+        return instance
+
 
 class BranchSerializer(serializers.ModelSerializer):
     """
@@ -22,36 +22,42 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 
+from apps.common.http import etag_matches, weak_etag
 from apps.common.mixins import StandardPagination
-from apps.orgs.models import Organisation, Branch
+from apps.orgs.models import Branch
 from apps.orgs.api.serializers import OrganisationSerializer, BranchSerializer
-from apps.orgs.api.permissions import IsOrgOwnerByMobile
+from apps.orgs.api.permissions import IsOrgOwnerByMobile, get_owner_org
 
 
 class OrganisationMeView(APIView):
     """
     GET  /api/org/me/   → returns the organisation owned by the request user
+                          (ETag / If-None-Match → 304 when unchanged)
     PATCH /api/org/me/  → updates name, owner_name, etc.
 
     Permission: IsOrgOwnerByMobile — user's mobile must match org.owner_mobile
     """
     permission_classes = [IsAuthenticated, IsOrgOwnerByMobile]
 
-    def _get_org(self, user) -> Organisation | None:
-        mobile = getattr(user, "mobile", None)
-        return Organisation.objects.filter(owner_mobile=mobile).first()
-
     def get(self, request):
-        org = self._get_org(request.user)
+        org = get_owner_org(request)
         if not org:
             return Response(
                 {"detail": "Organisation not found for this user."},
                 status=status.HTTP_404_NOT_FOUND,
             )
-        return Response(OrganisationSerializer(org).data, status=status.HTTP_200_OK)
+        # Dashboards poll this; unchanged orgs get an empty 304.
+        etag = weak_etag(org.pk, org.updated_at.timestamp())
+        if etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        return Response(
+            OrganisationSerializer(org).data,
+            status=status.HTTP_200_OK,
+            headers={"ETag": etag},
+        )
 
     def patch(self, request):
-        org = self._get_org(request.user)
+        org = get_owner_org(request)
         if not org:
             return Response(
                 {"detail": "Organisation not found for this user."},
@@ -74,16 +80,12 @@ class BranchViewSet(ModelViewSet):
     permission_classes = [IsAuthenticated, IsOrgOwnerByMobile]
     pagination_class = StandardPagination
 
-    def _get_owner_org(self) -> Organisation | None:
-        mobile = getattr(self.request.user, "mobile", None)
-        return Organisation.objects.filter(owner_mobile=mobile).first()
-
     def get_queryset(self):
-        org = self._get_owner_org()
+        org = get_owner_org(self.request)
         if not org:
             return Branch.objects.none()
         return Branch.objects.filter(organisation=org).order_by("-created_at")
 
     def perform_create(self, serializer):
-        org = self._get_owner_org()
+        org = get_owner_org(self.request)
         serializer.save(organisation=org)
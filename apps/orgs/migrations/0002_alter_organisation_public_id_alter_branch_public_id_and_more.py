@@ -0,0 +1,30 @@
+# Generated by Django 5.2.11 on 2026-10-16 10:31
+
+import apps.common.public_ids
+import apps.orgs.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orgs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='organisation',
+            name='public_id',
+            field=models.CharField(db_index=True, default=apps.common.public_ids.org_public_id, editable=False, max_length=20, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='branch',
+            name='public_id',
+            field=models.CharField(db_index=True, default=apps.common.public_ids.branch_public_id, editable=False, max_length=20, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='branch',
+            name='public_code',
+            field=models.CharField(db_index=True, default=apps.orgs.models.generate_join_code, max_length=12, unique=True),
+        ),
+    ]
@@ -2,10 +2,10 @@
 # Create your models here.
 from __future__ import annotations
 
-import random
-import string
+import base64
+import secrets
 
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.utils import timezone
 
 from apps.common.models import TimeStampedModel
@@ -17,9 +17,13 @@ except Exception:
     PointField = None
 
 
+JOIN_CODE_MAX_ATTEMPTS = 5
+
+
 def generate_join_code(length: int = 6) -> str:
-    chars = string.ascii_uppercase + string.digits
-    return "".join(random.choice(chars) for _ in range(length))
+    # Base32 alphabet is A-Z2-7; 5 random bytes encode to 8 chars.
+    nbytes = -(-length * 5 // 8)
+    return base64.b32encode(secrets.token_bytes(nbytes)).decode("ascii")[:length]
 
 
 class OrganisationStatus(models.TextChoices):
@@ -30,7 +34,7 @@ class OrganisationStatus(models.TextChoices):
 
 class Organisation(TimeStampedModel):
     id = models.BigAutoField(primary_key=True)
-    public_id = models.CharField(max_length=20, unique=True, db_index=True, editable=False)
+    public_id = models.CharField(max_length=20, unique=True, db_index=True, editable=False, default=org_public_id)
 
     name = models.CharField(max_length=180, db_index=True)
     slug = models.SlugField(max_length=180, unique=True)
@@ -47,11 +51,6 @@ class Organisation(TimeStampedModel):
             models.Index(fields=["name"]),
         ]
 
-    def save(self, *args, **kwargs):
-        if not self.public_id:
-            self.public_id = org_public_id()
-        super().save(*args, **kwargs)
-
     def __str__(self):
         return f"{self.public_id} {self.name}"
 
@@ -63,14 +62,14 @@ class BranchStatus(models.TextChoices):
 
 class Branch(TimeStampedModel):
     id = models.BigAutoField(primary_key=True)
-    public_id = models.CharField(max_length=20, unique=True, db_index=True, editable=False)
+    public_id = models.CharField(max_length=20, unique=True, db_index=True, editable=False, default=branch_public_id)
 
     organisation = models.ForeignKey(Organisation, on_delete=models.CASCADE, related_name="branches")
 
     name = models.CharField(max_length=140, db_index=True)
 
     # Students/Parents will type this to join
-    public_code = models.CharField(max_length=12, unique=True, db_index=True)
+    public_code = models.CharField(max_length=12, unique=True, db_index=True, default=generate_join_code)
 
     address_line1 = models.CharField(max_length=200)
     address_line2 = models.CharField(max_length=200, blank=True)
@@ -101,15 +100,21 @@ class Branch(TimeStampedModel):
         ]
 
     def save(self, *args, **kwargs):
-        if not self.public_id:
-            self.public_id = branch_public_id()
-        if not self.public_code:
-            # generate unique join code
-            code = generate_join_code()
-            while Branch.objects.filter(public_code=code).exists():
-                code = generate_join_code()
-            self.public_code = code
-        super().save(*args, **kwargs)
+        if not self._state.adding:
+            super().save(*args, **kwargs)
+            return
+
+        # Let the unique index arbitrate join-code collisions on insert;
+        # the savepoint keeps the outer (request) transaction usable on retry.
+        for attempt in range(JOIN_CODE_MAX_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError as e:
+                if "public_code" not in str(e) or attempt == JOIN_CODE_MAX_ATTEMPTS - 1:
+                    raise
+                self.public_code = generate_join_code()
 
     def __str__(self):
         return f"{self.public_id} {self.name}"
\ No newline at end of file
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from rest_framework import serializers
+from apps.common.serializers import SerializerCacheMixin
 from apps.reviews.models import Review, ReviewStatus
 
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(SerializerCacheMixin, serializers.ModelSerializer):
     class Meta:
         model = Review
         fields = [
@@ -21,4 +22,10 @@ class ReviewSerializer(serializers.ModelSerializer):
 
 
 class ReviewModerateSerializer(serializers.Serializer):
-    note = serializers.CharField(required=False, allow_blank=True, max_length=200)
\ No newline at end of file
+    note = serializers.CharField(required=False, allow_blank=True, max_length=200)
+
+
+class ReviewBulkModerateSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(), min_length=1, max_length=500)
+    decision = serializers.ChoiceField(choices=[ReviewStatus.APPROVED, ReviewStatus.REJECTED])
+    note = serializers.CharField(required=False, allow_blank=True, max_length=200, default="")
@@ -9,22 +9,38 @@ GET             /api/reviews/                 Admin: list all reviews
 POST            /api/reviews/public-submit/   Public: submit a review
 POST            /api/reviews/{id}/approve/    Admin: approve
 POST            /api/reviews/{id}/reject/     Admin: reject
+POST            /api/reviews/bulk-moderate/   Admin: approve/reject many
 """
 from __future__ import annotations
 
-from django.db import transaction
+import hashlib
+
+from django.core.cache import cache
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.decorators import action
-from rest_framework.exceptions import ValidationError
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
-from apps.common.mixins import TenantViewSet, StatusFilterMixin, ApproveRejectMixin
+from apps.accounts.throttles import ScopedThrottle
+from apps.common.mixins import (
+    TenantViewSet,
+    StatusFilterMixin,
+    ApproveRejectMixin,
+    CreatedAtCursorPagination,
+)
 from apps.common.permissions import IsBranchAdmin
-from apps.orgs.models import Organisation, Branch
+from apps.orgs.models import Branch
 from apps.reviews.models import Review, ReviewStatus
-from apps.reviews.api.serializers import ReviewSerializer, ReviewModerateSerializer
+from apps.reviews.api.serializers import (
+    ReviewSerializer,
+    ReviewModerateSerializer,
+    ReviewBulkModerateSerializer,
+)
+
+# Identical public submissions (same branch/mobile/rating/comment) within this window are dropped.
+PUBLIC_SUBMIT_DEDUPE_TTL = 10 * 60
 
 
 class ReviewViewSet(StatusFilterMixin, ApproveRejectMixin, TenantViewSet):
@@ -35,6 +51,7 @@ class ReviewViewSet(StatusFilterMixin, ApproveRejectMixin, TenantViewSet):
         list / retrieve               → IsBranchAdmin
         public-submit                 → AllowAny
         approve / reject              → IsBranchAdmin  (from ApproveRejectMixin)
+        bulk-moderate                 → IsBranchAdmin
 
     Query params:
         ?status=PENDING | APPROVED | REJECTED
@@ -49,7 +66,12 @@ class ReviewViewSet(StatusFilterMixin, ApproveRejectMixin, TenantViewSet):
     permission_classes = [IsBranchAdmin]
     queryset = Review.objects.all()
     ordering = ["-created_at"]
+    # Moderation backlogs can grow large — keyset pages instead of OFFSET.
+    pagination_class = CreatedAtCursorPagination
     http_method_names = ["get", "post", "delete"]
+    # Set per action; ScopedThrottle (a default throttle) skips views without one.
+    throttle_scope = None
+    approve_reject_fetch_object = False
 
     def get_queryset(self):
         qs = super().get_queryset()
@@ -63,6 +85,8 @@ class ReviewViewSet(StatusFilterMixin, ApproveRejectMixin, TenantViewSet):
         detail=False,
         methods=["post"],
         permission_classes=[AllowAny],
+        throttle_classes=[ScopedThrottle],
+        throttle_scope="reviews_public",
         url_path="public-submit",
     )
     def public_submit(self, request):
@@ -81,58 +105,123 @@ class ReviewViewSet(StatusFilterMixin, ApproveRejectMixin, TenantViewSet):
         if not org_pid or not br_pid:
             raise ValidationError({"detail": "org and branch are required."})
 
-        org = Organisation.objects.filter(public_id=org_pid).first()
-        if not org:
-            raise ValidationError({"detail": "Invalid organisation."})
-
-        branch = Branch.objects.filter(public_id=br_pid, organisation=org).first()
-        if not branch:
-            raise ValidationError({"detail": "Invalid branch."})
+        # One JOIN resolves both public ids; only the PKs are needed to link the review.
+        row = (
+            Branch.objects
+            .filter(public_id=br_pid, organisation__public_id=org_pid)
+            .values("id", "organisation_id")
+            .first()
+        )
+        if not row:
+            raise ValidationError({"detail": "Invalid organisation or branch."})
 
         serializer = ReviewSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-
-        review = Review.objects.create(
-            organisation=org,
-            branch=branch,
-            author_name=serializer.validated_data.get("author_name", ""),
-            author_mobile=serializer.validated_data.get("author_mobile", ""),
-            rating=serializer.validated_data["rating"],
-            title=serializer.validated_data.get("title", ""),
-            comment=serializer.validated_data.get("comment", ""),
-            status=ReviewStatus.PENDING,
-        )
+        data = serializer.validated_data
+
+        mobile = data.get("author_mobile", "")
+        comment = data.get("comment", "")
+        dedupe_key = None
+        # Anonymous star-only reviews carry nothing to tell repeats apart.
+        if mobile or comment:
+            comment_digest = hashlib.blake2b(comment.encode(), digest_size=8).hexdigest()
+            dedupe_key = f"rev:{row['id']}:{mobile}:{data['rating']}:{comment_digest}"
+            # add() is False only when the key already exists (None if the cache is unavailable).
+            if cache.add(dedupe_key, 1, PUBLIC_SUBMIT_DEDUPE_TTL) is False:
+                return Response(
+                    {"detail": "Duplicate review."},
+                    status=status.HTTP_409_CONFLICT,
+                )
+
+        try:
+            review = Review.objects.create(
+                organisation_id=row["organisation_id"],
+                branch_id=row["id"],
+                author_name=data.get("author_name", ""),
+                author_mobile=mobile,
+                rating=data["rating"],
+                title=data.get("title", ""),
+                comment=comment,
+                status=ReviewStatus.PENDING,
+            )
+        except Exception:
+            # Don't let a failed insert block the client's retry.
+            if dedupe_key:
+                cache.delete(dedupe_key)
+            raise
         return Response(
             {"message": "Review submitted.", "id": review.id},
             status=status.HTTP_201_CREATED,
         )
 
-    # ── ApproveRejectMixin hooks ──────────────────────────────────────────────
+    @action(detail=False, methods=["post"], url_path="bulk-moderate")
+    def bulk_moderate(self, request):
+        """
+        POST /api/reviews/bulk-moderate/
+
+        Body:
+            ids       list[int]  required  (max 500)
+            decision  string     required  APPROVED | REJECTED
+            note      string     optional
 
-    @transaction.atomic
-    def _do_approve(self, request, review: Review) -> dict:
-        serializer = ReviewModerateSerializer(data=request.data)
+        Moderates every matching review in this branch with one UPDATE.
+        Response: { updated }
+        """
+        ctx = self.get_tenant()
+        serializer = ReviewBulkModerateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
+        vd = serializer.validated_data
+
+        now = timezone.now()
+        updated = Review.objects.filter(
+            id__in=vd["ids"],
+            organisation=ctx.organisation,
+            branch=ctx.branch,
+        ).update(
+            status=vd["decision"],
+            moderated_by=request.user,
+            moderated_at=now,
+            moderation_note=vd["note"],
+            updated_at=now,
+        )
+        return Response({"updated": updated}, status=status.HTTP_200_OK)
 
-        review.status = ReviewStatus.APPROVED
-        review.moderated_by = request.user
-        review.moderated_at = timezone.now()
-        review.moderation_note = serializer.validated_data.get("note", "")
-        review.save(update_fields=[
-            "status", "moderated_by", "moderated_at", "moderation_note", "updated_at"
-        ])
+    # ── ApproveRejectMixin hooks ──────────────────────────────────────────────
+    # approve_reject_fetch_object = False: hooks get review=None and update by pk.
+
+    def _moderate(self, request, new_status: str) -> None:
+        # Common case is a bare "Approve"/"Reject" click with no body — only
+        # validate when a note was actually sent.
+        note = ""
+        if request.data:
+            serializer = ReviewModerateSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            note = serializer.validated_data.get("note", "")
+
+        ctx = self.get_tenant()
+        now = timezone.now()
+        try:
+            updated = Review.objects.filter(
+                pk=self.kwargs["pk"],
+                organisation=ctx.organisation,
+                branch=ctx.branch,
+            ).update(
+                status=new_status,
+                moderated_by_id=request.user.pk,
+                moderated_at=now,
+                moderation_note=note,
+                # QuerySet.update() bypasses auto_now
+                updated_at=now,
+            )
+        except (TypeError, ValueError):
+            updated = 0
+        if not updated:
+            raise NotFound()
+
+    def _do_approve(self, request, review: Review | None) -> dict:
+        self._moderate(request, ReviewStatus.APPROVED)
         return {"message": "Review approved."}
 
-    @transaction.atomic
-    def _do_reject(self, request, review: Review) -> dict:
-        serializer = ReviewModerateSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-
-        review.status = ReviewStatus.REJECTED
-        review.moderated_by = request.user
-        review.moderated_at = timezone.now()
-        review.moderation_note = serializer.validated_data.get("note", "")
-        review.save(update_fields=[
-            "status", "moderated_by", "moderated_at", "moderation_note", "updated_at"
-        ])
+    def _do_reject(self, request, review: Review | None) -> dict:
+        self._moderate(request, ReviewStatus.REJECTED)
         return {"message": "Review rejected."}
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.11 on 2026-10-16 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(condition=models.Q(('status', 'PENDING')), fields=['organisation', 'branch', 'created_at'], name='ix_rev_pending'),
+        ),
+    ]
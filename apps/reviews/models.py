@@ -36,4 +36,6 @@ class Review(TimeStampedModel):
             models.Index(fields=["organisation", "status", "created_at"]),
             models.Index(fields=["branch", "status", "created_at"]),
             models.Index(fields=["organisation", "rating"]),
+            # Moderation queue (?status=PENDING) scans only pending rows
+            models.Index(fields=["organisation", "branch", "created_at"], condition=models.Q(status="PENDING"), name="ix_rev_pending"),
         ]
\ No newline at end of file
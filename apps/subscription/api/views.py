@@ -11,18 +11,27 @@ GET /api/subscription/usage/   Current usage counts vs plan limits  ← FIX #6 (
 """
 from __future__ import annotations
 
+from functools import lru_cache
+
+from django.core.cache import cache
+from django.db.models import Case, Count, DateField, F, IntegerField, Q, Value, When
+from django.db.models.functions import ExtractDay, Greatest
+from django.utils import timezone
 from rest_framework import serializers, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.common.http import etag_matches, weak_etag
 from apps.common.permissions import IsBranchAdmin
+from apps.common.serializers import SerializerCacheMixin
 from apps.billing.models import SubscriptionPlan, OrganisationSubscription
+from apps.subscription.signals import PLANS_CACHE_KEY, PLANS_CACHE_TTL
 
 
 # ─── Serializers ─────────────────────────────────────────────────────────────
 
-class SubscriptionPlanSerializer(serializers.ModelSerializer):
+class SubscriptionPlanSerializer(SerializerCacheMixin, serializers.ModelSerializer):
     class Meta:
         model = SubscriptionPlan
         fields = [
@@ -40,9 +49,10 @@ class SubscriptionPlanSerializer(serializers.ModelSerializer):
         ]
 
 
-class OrganisationSubscriptionSerializer(serializers.ModelSerializer):
+class OrganisationSubscriptionSerializer(SerializerCacheMixin, serializers.ModelSerializer):
     plan = SubscriptionPlanSerializer(read_only=True)
-    days_remaining = serializers.SerializerMethodField()
+    # Annotated by SubscriptionDetailView (see _with_days_remaining).
+    days_remaining = serializers.IntegerField(read_only=True, allow_null=True)
 
     class Meta:
         model = OrganisationSubscription
@@ -55,13 +65,31 @@ class OrganisationSubscriptionSerializer(serializers.ModelSerializer):
             "days_remaining",
         ]
 
-    def get_days_remaining(self, obj) -> int | None:
-        from django.utils import timezone
-        today = timezone.localdate()
-        if obj.expires_on:
-            delta = (obj.expires_on - today).days
-            return max(delta, 0)
-        return None
+
+@lru_cache(maxsize=2048)
+def _usage_pct(used: int, limit: int | None) -> float | None:
+    # Plan limits are a handful of values and usage polls repeat, so memoize.
+    return round(used / limit * 100, 1) if limit else None
+
+
+def _slot(used: int, limit: int | None) -> dict:
+    """Build { used, limit, pct } — pct is null when there's no limit."""
+    return {"used": used, "limit": limit, "pct": _usage_pct(used, limit)}
+
+
+def _with_days_remaining(qs):
+    """Annotate days_remaining = max(expires_on - today, 0), NULL when open-ended."""
+    today = timezone.localdate()
+    return qs.annotate(
+        days_remaining=Case(
+            When(expires_on__isnull=True, then=Value(None)),
+            default=Greatest(
+                ExtractDay(F("expires_on") - Value(today, output_field=DateField())),
+                Value(0),
+            ),
+            output_field=IntegerField(),
+        ),
+    )
 
 
 # ─── Views ────────────────────────────────────────────────────────────────────
@@ -72,6 +100,7 @@ class SubscriptionDetailView(APIView):
 
     Returns the current organisation's active subscription, including plan limits
     and feature flags. Used for feature-gating on the frontend.
+    Supports If-None-Match — returns 304 while subscription and plan are unchanged.
 
     Permission: IsBranchAdmin
     """
@@ -81,20 +110,26 @@ class SubscriptionDetailView(APIView):
         from apps.common.tenant import get_tenant_context
         ctx = get_tenant_context(request)
 
-        sub = (
-            OrganisationSubscription.objects
-            .select_related("plan")
-            .filter(organisation=ctx.organisation)
-            .first()
-        )
-        if not sub:
+        subs = OrganisationSubscription.objects.filter(organisation=ctx.organisation)
+
+        # Cheap probe first: the ETag only needs the timestamps (+ today,
+        # since days_remaining changes daily). Full row only on a miss.
+        stamp = subs.values("id", "updated_at", "plan__updated_at").first()
+        if not stamp:
             return Response(
                 {"detail": "No subscription found for this organisation."},
                 status=status.HTTP_404_NOT_FOUND,
             )
+        plan_ts = stamp["plan__updated_at"].timestamp() if stamp["plan__updated_at"] else 0
+        etag = weak_etag(stamp["id"], stamp["updated_at"].timestamp(), plan_ts, timezone.localdate().isoformat())
+        if etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        sub = _with_days_remaining(subs.select_related("plan")).first()
         return Response(
             OrganisationSubscriptionSerializer(sub).data,
             status=status.HTTP_200_OK,
+            headers={"ETag": etag},
         )
 
 
@@ -106,15 +141,19 @@ class SubscriptionPlanListView(APIView):
     Used on the pricing/upgrade page.
 
     Permission: IsAuthenticated
+
+    Plans change rarely, so the serialized list is cached (5 min TTL) and
+    dropped whenever a SubscriptionPlan is saved or deleted.
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        plans = SubscriptionPlan.objects.filter(is_public=True).order_by("price_monthly_inr")
-        return Response(
-            SubscriptionPlanSerializer(plans, many=True).data,
-            status=status.HTTP_200_OK,
-        )
+        data = cache.get(PLANS_CACHE_KEY)
+        if data is None:
+            plans = SubscriptionPlan.objects.filter(is_public=True).order_by("price_monthly_inr")
+            data = SubscriptionPlanSerializer(plans, many=True).data
+            cache.set(PLANS_CACHE_KEY, data, PLANS_CACHE_TTL)
+        return Response(data, status=status.HTTP_200_OK)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -161,12 +200,6 @@ class SubscriptionUsageView(APIView):
     """
     permission_classes = [IsBranchAdmin]
 
-    @staticmethod
-    def _slot(used: int, limit: int | None) -> dict:
-        """Build { used, limit, pct } — pct is null when there's no limit."""
-        pct = round(used / limit * 100, 1) if limit else None
-        return {"used": used, "limit": limit, "pct": pct}
-
     def get(self, request):
         from apps.common.tenant import get_tenant_context
         from apps.academics.models import StudentProfile, TeacherProfile
@@ -186,45 +219,40 @@ class SubscriptionUsageView(APIView):
         branch_limit  = plan.branch_limit  if plan else None
         teacher_limit = plan.teacher_limit if plan else None
 
-        # ── Org-level counts ──────────────────────────────────────────────────
+        # ── Counts: one conditional aggregate per profile table ───────────────
+        # Only columns in ix_*_active_org_br are read, so Postgres can count from
+        # the partial index alone (Django rejects a filter on Count("*")).
         branch_count = Branch.objects.filter(
             organisation=ctx.organisation,
         ).count()
 
-        org_students = StudentProfile.objects.filter(
-            organisation=ctx.organisation,
-            is_active_for_login=True,
-        ).count()
-
-        org_teachers = TeacherProfile.objects.filter(
+        students = StudentProfile.objects.filter(
             organisation=ctx.organisation,
             is_active_for_login=True,
-        ).count()
-
-        # ── Branch-level counts ───────────────────────────────────────────────
-        br_students = StudentProfile.objects.filter(
-            organisation=ctx.organisation,
-            branch=ctx.branch,
-            is_active_for_login=True,
-        ).count()
+        ).aggregate(
+            org=Count("*"),
+            branch=Count("branch", filter=Q(branch=ctx.branch)),
+        )
 
-        br_teachers = TeacherProfile.objects.filter(
+        teachers = TeacherProfile.objects.filter(
             organisation=ctx.organisation,
-            branch=ctx.branch,
             is_active_for_login=True,
-        ).count()
+        ).aggregate(
+            org=Count("*"),
+            branch=Count("branch", filter=Q(branch=ctx.branch)),
+        )
 
         return Response(
             {
                 "plan_code": plan.code if plan else None,
                 "org_level": {
-                    "branches":       self._slot(branch_count, branch_limit),
-                    "students_total": self._slot(org_students, student_limit),
-                    "teachers_total": self._slot(org_teachers, teacher_limit),
+                    "branches":       _slot(branch_count, branch_limit),
+                    "students_total": _slot(students["org"], student_limit),
+                    "teachers_total": _slot(teachers["org"], teacher_limit),
                 },
                 "this_branch": {
-                    "students": self._slot(br_students, student_limit),
-                    "teachers": self._slot(br_teachers, teacher_limit),
+                    "students": _slot(students["branch"], student_limit),
+                    "teachers": _slot(teachers["branch"], teacher_limit),
                 },
             },
             status=status.HTTP_200_OK,
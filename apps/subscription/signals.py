@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.billing.models import SubscriptionPlan
+
+# Serialized public plan list served by SubscriptionPlanListView.
+PLANS_CACHE_KEY = "subscription:plans"
+PLANS_CACHE_TTL = 5 * 60
+
+
+@receiver([post_save, post_delete], sender=SubscriptionPlan)
+def invalidate_plans_cache(sender, **kwargs):
+    # Drop after commit so a concurrent request can't re-cache the old rows.
+    transaction.on_commit(lambda: cache.delete(PLANS_CACHE_KEY))
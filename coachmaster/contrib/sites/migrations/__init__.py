@@ -1,5 +0,0 @@
-"""
-To understand why this file is here, please read:
-
-https://cookiecutter-django.readthedocs.io/en/latest/5-help/faq.html#why-is-there-a-django-contrib-sites-directory-in-cookiecutter-django
-"""
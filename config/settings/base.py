@@ -3,7 +3,9 @@
 
 from __future__ import annotations
 
-import ssl
+import os
+import re
+import sys
 from datetime import timedelta
 from pathlib import Path
 
@@ -18,15 +20,34 @@ APPS_DIR = BASE_DIR / "coachmaster"
 
 env = environ.Env()
 
-READ_DOT_ENV_FILE = env.bool("DJANGO_READ_DOT_ENV_FILE", default=False)
-if READ_DOT_ENV_FILE:
+_TRUE_STRINGS = frozenset(environ.Env.BOOLEAN_TRUE_STRINGS)
+
+
+def env_bool(name: str, *, default: bool = False) -> bool:
+    """Same truthiness as env.bool(), read straight from os.environ.
+
+    Flags don't need django-environ's cast/proxy machinery; keep `env` for
+    URL-valued keys (env.db, env.url) and lists.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    value = value.strip().lower()
+    return value in _TRUE_STRINGS or (value.isdigit() and int(value) != 0)
+
+
+READ_DOT_ENV_FILE = env_bool("DJANGO_READ_DOT_ENV_FILE", default=False)
+# read_env() only fills os.environ, which child processes (e.g. the runserver
+# autoreloader) inherit, so parse the file once per process tree.
+if READ_DOT_ENV_FILE and not os.environ.get("_DOTENV_LOADED"):
     env.read_env(str(BASE_DIR / ".env"))
+    os.environ["_DOTENV_LOADED"] = "1"
 
 
 # ------------------------------------------------------------------------------
 # GENERAL
 # ------------------------------------------------------------------------------
-DEBUG = env.bool("DJANGO_DEBUG", False)
+DEBUG = env_bool("DJANGO_DEBUG", default=False)
 
 TIME_ZONE = "Asia/Kolkata"
 LANGUAGE_CODE = "en-us"
@@ -34,9 +55,7 @@ LANGUAGE_CODE = "en-us"
 USE_I18N = True
 USE_TZ = True
 
-SITE_ID = 1
-
-LOCALE_PATHS = [str(BASE_DIR / "locale")]
+LOCALE_PATHS = [BASE_DIR / "locale"]
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -45,12 +64,11 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # DATABASES
 # ------------------------------------------------------------------------------
 DATABASES = {
-    "default": env.db(
-        "DATABASE_URL",
-        default="postgres:///coachmaster",
-    )
+    "default": {
+        **env.db("DATABASE_URL", default="postgres:///coachmaster"),
+        "ATOMIC_REQUESTS": True,
+    },
 }
-DATABASES["default"]["ATOMIC_REQUESTS"] = True
 
 
 # ------------------------------------------------------------------------------
@@ -63,29 +81,33 @@ WSGI_APPLICATION = "config.wsgi.application"
 # ------------------------------------------------------------------------------
 # APPS
 # ------------------------------------------------------------------------------
-DJANGO_APPS = [
+DJANGO_APPS = (
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",
-    "django.contrib.sites",
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.admin",
     "django.forms",
-]
+)
 
-THIRD_PARTY_APPS = [
+THIRD_PARTY_APPS = (
     "corsheaders",
-    "drf_spectacular",
     "rest_framework",
     "rest_framework_simplejwt",
-    "rest_framework_simplejwt.token_blacklist",
     "crispy_forms",
     "crispy_bootstrap5",
+)
+
+# Only needed by the web/worker processes (JWT blacklist, beat scheduler).
+# manage.py sets DJANGO_FULL_APPS=0 for light commands so they skip these
+# apps' imports and ready() hooks.
+_WEB_ONLY_APPS = (
+    "rest_framework_simplejwt.token_blacklist",
     "django_celery_beat",
-]
+)
 
-LOCAL_APPS = [
+LOCAL_APPS = (
     # Optional (if you enable PostGIS):
     # "django.contrib.gis",
 
@@ -103,9 +125,23 @@ LOCAL_APPS = [
     "apps.api",
     "apps.dashboard",
     "apps.subscription",
-]
+)
+
+INSTALLED_APPS = (
+    DJANGO_APPS
+    + THIRD_PARTY_APPS
+    + LOCAL_APPS
+    + (_WEB_ONLY_APPS if env_bool("DJANGO_FULL_APPS", default=True) else ())
+)
 
-INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
+# API docs (/api/schema/, /api/docs/) are opt-in: set DJANGO_ENABLE_SPECTACULAR
+# to serve them. They are always on for runserver and `manage.py spectacular`.
+if (
+    env_bool("DJANGO_ENABLE_SPECTACULAR", default=False)
+    or "runserver" in sys.argv
+    or "spectacular" in sys.argv
+):
+    INSTALLED_APPS += ("drf_spectacular",)
 
 
 # ------------------------------------------------------------------------------
@@ -113,33 +149,32 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 # ------------------------------------------------------------------------------
 AUTH_USER_MODEL = "accounts.User"
 
-AUTHENTICATION_BACKENDS = [
+AUTHENTICATION_BACKENDS = (
     "apps.accounts.backends.MobileBackend",
-]
+)
 
 
 # ------------------------------------------------------------------------------
 # PASSWORDS
 # ------------------------------------------------------------------------------
-PASSWORD_HASHERS = [
-    "django.contrib.auth.hashers.Argon2PasswordHasher",
+PASSWORD_HASHERS = (
+    "apps.accounts.hashers.TunedArgon2PasswordHasher",
+    # Verifies Django-default hashes; they're upgraded to argon2 on next login.
     "django.contrib.auth.hashers.PBKDF2PasswordHasher",
-    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
-    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
-]
+)
 
-AUTH_PASSWORD_VALIDATORS = [
+AUTH_PASSWORD_VALIDATORS = (
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
     {"NAME": "django.contrib.auth.password_validation.CommonPasswordValidator"},
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
-]
+)
 
 
 # ------------------------------------------------------------------------------
 # MIDDLEWARE
 # ------------------------------------------------------------------------------
-MIDDLEWARE = [
+MIDDLEWARE = (
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",  # keep near top
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -149,22 +184,22 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-]
+)
 
 
 # ------------------------------------------------------------------------------
 # STATIC & MEDIA
 # ------------------------------------------------------------------------------
 STATIC_URL = "/static/"
-STATIC_ROOT = str(BASE_DIR / "staticfiles")
-STATICFILES_DIRS = [str(BASE_DIR / "static")]
-STATICFILES_FINDERS = [
+STATIC_ROOT = BASE_DIR / "staticfiles"
+STATICFILES_DIRS = [BASE_DIR / "static"]
+STATICFILES_FINDERS = (
     "django.contrib.staticfiles.finders.FileSystemFinder",
     "django.contrib.staticfiles.finders.AppDirectoriesFinder",
-]
+)
 
 MEDIA_URL = "/media/"
-MEDIA_ROOT = str(APPS_DIR / "media")
+MEDIA_ROOT = APPS_DIR / "media"
 
 
 # ------------------------------------------------------------------------------
@@ -173,7 +208,7 @@ MEDIA_ROOT = str(APPS_DIR / "media")
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
-        "DIRS": [str(BASE_DIR / "templates")],
+        "DIRS": [BASE_DIR / "templates"],
         "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
@@ -199,11 +234,6 @@ CRISPY_ALLOWED_TEMPLATE_PACKS = "bootstrap5"
 # ------------------------------------------------------------------------------
 # DRF (JWT only)
 # ------------------------------------------------------------------------------
-# settings.py
-
-# Check if we are in Debug Mode
-DEBUG = True  # This is usually at the top of your file
-
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework_simplejwt.authentication.JWTAuthentication",
@@ -215,14 +245,13 @@ REST_FRAMEWORK = {
 
     # Throttling Configuration
     "DEFAULT_THROTTLE_CLASSES": (
-        "rest_framework.throttling.AnonRateThrottle",
-        "rest_framework.throttling.UserRateThrottle",
-        "apps.accounts.throttles.LoginRateThrottle",
-        "apps.accounts.throttles.BranchJoinRateThrottle",
-        "apps.accounts.throttles.OrgSignupRateThrottle",
+        "apps.accounts.throttles.AnonThrottle",
+        "apps.accounts.throttles.UserThrottle",
+        # login / branch_join / org_signup / reviews_public, via throttle_scope
+        "apps.accounts.throttles.ScopedThrottle",
     ),
     
-    # LOGIC: If DEBUG is True, allow huge limits. If False, use strict limits.
+    # Strict unless DJANGO_DEBUG is set; local.py / test.py relax them.
     "DEFAULT_THROTTLE_RATES": {
         "anon": "10000/day" if DEBUG else "200/day",
         "user": "10000/day" if DEBUG else "2000/day",
@@ -231,6 +260,7 @@ REST_FRAMEWORK = {
         "login": "1000/min" if DEBUG else "10/min", 
         "branch_join": "1000/hour" if DEBUG else "6/hour",
         "org_signup": "1000/day" if DEBUG else "5/day",
+        "reviews_public": "1000/min" if DEBUG else "5/min",
     },
 
     "EXCEPTION_HANDLER": "apps.accounts.exceptions.custom_exception_handler",
@@ -259,7 +289,7 @@ SIMPLE_JWT = {
 # ------------------------------------------------------------------------------
 # CORS
 # ------------------------------------------------------------------------------
-CORS_URLS_REGEX = r"^/api/.*$"
+CORS_URLS_REGEX = re.compile(r"^/api/.*\Z")
 
 # Recommended (set from env in prod):
 # CORS_ALLOWED_ORIGINS = env.list("CORS_ALLOWED_ORIGINS", default=[])
@@ -346,7 +376,12 @@ if USE_TZ:
 CELERY_BROKER_URL = REDIS_URL
 CELERY_RESULT_BACKEND = REDIS_URL
 
-CELERY_BROKER_USE_SSL = {"ssl_cert_reqs": ssl.CERT_NONE} if REDIS_SSL else None
+if REDIS_SSL:
+    import ssl
+
+    CELERY_BROKER_USE_SSL = {"ssl_cert_reqs": ssl.CERT_NONE}
+else:
+    CELERY_BROKER_USE_SSL = None
 CELERY_REDIS_BACKEND_USE_SSL = CELERY_BROKER_USE_SSL
 
 CELERY_RESULT_EXTENDED = True
@@ -1,8 +1,10 @@
 # ruff: noqa: E501
 from __future__ import annotations
 
+import sys
+
 from .base import *  # noqa: F403
-from .base import DATABASES, INSTALLED_APPS, REDIS_URL, SPECTACULAR_SETTINGS, env  # noqa: F401
+from .base import DATABASES, INSTALLED_APPS, REDIS_URL, SPECTACULAR_SETTINGS, env, env_bool  # noqa: F401
 
 # ------------------------------------------------------------------------------
 # GENERAL
@@ -11,9 +13,17 @@ DEBUG = False
 
 SECRET_KEY = env("DJANGO_SECRET_KEY")
 
-ALLOWED_HOSTS = env.list(
-    "DJANGO_ALLOWED_HOSTS",
-    default=["coachmaster.in", "www.coachmaster.in"],
+
+def _hosts(values):
+    """Lower-cased, interned tuple for the per-request host/origin checks."""
+    return tuple(sys.intern(value.lower()) for value in values)
+
+
+ALLOWED_HOSTS = _hosts(
+    env.list(
+        "DJANGO_ALLOWED_HOSTS",
+        default=["coachmaster.in", "www.coachmaster.in"],
+    ),
 )
 
 # If you are behind nginx / load balancer:
@@ -24,10 +34,17 @@ SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 # ------------------------------------------------------------------------------
 # DATABASE
 # ------------------------------------------------------------------------------
-DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)
-
-# Django 4.2+ (safe to keep; ignored in older versions)
-DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+DATABASES["default"].update(
+    {
+        "CONN_MAX_AGE": env.int("CONN_MAX_AGE", default=60),
+        # Django 4.2+ (safe to keep; ignored in older versions)
+        "CONN_HEALTH_CHECKS": True,
+        # Set when DATABASE_URL points at PgBouncer in transaction pooling mode
+        # (pool_size ~25): server-side cursors don't survive across pooled
+        # transactions.
+        "DISABLE_SERVER_SIDE_CURSORS": env_bool("DJANGO_DB_PGBOUNCER", default=False),
+    },
+)
 
 
 # ------------------------------------------------------------------------------
@@ -39,17 +56,37 @@ CACHES = {
         "LOCATION": REDIS_URL,
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            # redis-py picks the hiredis C parser automatically (hiredis is a
+            # dependency), so no PARSER_CLASS is needed.
+            "CONNECTION_POOL_KWARGS": {"max_connections": 50},
+            # Fail fast so IGNORE_EXCEPTIONS can fall through to the DB
+            "SOCKET_CONNECT_TIMEOUT": 2,
+            "SOCKET_TIMEOUT": 2,
             # Avoid hard failures if redis temporarily down
             "IGNORE_EXCEPTIONS": True,
         },
     },
+    # DRF throttle histories (apps.accounts.throttles.THROTTLE_CACHE_ALIAS):
+    # their own pool so throttle traffic can't starve the default cache.
+    "throttle": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": env("THROTTLE_REDIS_URL", default=REDIS_URL),
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "CONNECTION_POOL_KWARGS": {"max_connections": 50},
+            "SOCKET_CONNECT_TIMEOUT": 2,
+            "SOCKET_TIMEOUT": 2,
+            # A throttle that can't reach redis lets the request through
+            "IGNORE_EXCEPTIONS": True,
+        },
+    },
 }
 
 
 # ------------------------------------------------------------------------------
 # SECURITY (HARDENED)
 # ------------------------------------------------------------------------------
-SECURE_SSL_REDIRECT = env.bool("DJANGO_SECURE_SSL_REDIRECT", default=True)
+SECURE_SSL_REDIRECT = env_bool("DJANGO_SECURE_SSL_REDIRECT", default=True)
 
 SESSION_COOKIE_SECURE = True
 CSRF_COOKIE_SECURE = True
@@ -59,10 +96,13 @@ SESSION_COOKIE_HTTPONLY = True
 CSRF_COOKIE_HTTPONLY = True
 
 SESSION_COOKIE_NAME = "__Secure-sessionid"
+# Sessions only back the admin (the API is JWT). Reads come from redis; the
+# write-through to django_session keeps logins working if redis is down.
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
 CSRF_COOKIE_NAME = "__Secure-csrftoken"
 
 # Modern recommended settings
-SECURE_CONTENT_TYPE_NOSNIFF = env.bool("DJANGO_SECURE_CONTENT_TYPE_NOSNIFF", default=True)
+SECURE_CONTENT_TYPE_NOSNIFF = env_bool("DJANGO_SECURE_CONTENT_TYPE_NOSNIFF", default=True)
 SECURE_REFERRER_POLICY = env("DJANGO_SECURE_REFERRER_POLICY", default="same-origin")
 
 # Clickjacking protection
@@ -73,8 +113,8 @@ X_FRAME_OPTIONS = "DENY"
 # HSTS rollout:
 # Start with 60 seconds, then 1 day, then 6 months+ once verified.
 SECURE_HSTS_SECONDS = env.int("DJANGO_SECURE_HSTS_SECONDS", default=60)
-SECURE_HSTS_INCLUDE_SUBDOMAINS = env.bool("DJANGO_SECURE_HSTS_INCLUDE_SUBDOMAINS", default=True)
-SECURE_HSTS_PRELOAD = env.bool("DJANGO_SECURE_HSTS_PRELOAD", default=True)
+SECURE_HSTS_INCLUDE_SUBDOMAINS = env_bool("DJANGO_SECURE_HSTS_INCLUDE_SUBDOMAINS", default=True)
+SECURE_HSTS_PRELOAD = env_bool("DJANGO_SECURE_HSTS_PRELOAD", default=True)
 
 # Cross-origin opener policy (protects from tabnabbing)
 SECURE_CROSS_ORIGIN_OPENER_POLICY = env(
@@ -86,40 +126,46 @@ SECURE_CROSS_ORIGIN_OPENER_POLICY = env(
 # CORS / CSRF TRUST
 # ------------------------------------------------------------------------------
 # If frontend calls API from these domains:
-CORS_ALLOWED_ORIGINS = env.list(
-    "DJANGO_CORS_ALLOWED_ORIGINS",
-    default=[
-        "https://coachmaster.in",
-        "https://www.coachmaster.in",
-    ],
+CORS_ALLOWED_ORIGINS = _hosts(
+    env.list(
+        "DJANGO_CORS_ALLOWED_ORIGINS",
+        default=[
+            "https://coachmaster.in",
+            "https://www.coachmaster.in",
+        ],
+    ),
 )
 
 # Required for CSRF in some cases; safe to set anyway
-CSRF_TRUSTED_ORIGINS = env.list(
-    "DJANGO_CSRF_TRUSTED_ORIGINS",
-    default=[
-        "https://coachmaster.in",
-        "https://www.coachmaster.in",
-    ],
+CSRF_TRUSTED_ORIGINS = _hosts(
+    env.list(
+        "DJANGO_CSRF_TRUSTED_ORIGINS",
+        default=[
+            "https://coachmaster.in",
+            "https://www.coachmaster.in",
+        ],
+    ),
 )
 
 # If you use Authorization header (JWT), allow it:
-CORS_ALLOW_HEADERS = env.list(
-    "DJANGO_CORS_ALLOW_HEADERS",
-    default=[
-        "accept",
-        "accept-encoding",
-        "authorization",
-        "content-type",
-        "dnt",
-        "origin",
-        "user-agent",
-        "x-csrftoken",
-        "x-requested-with",
-    ],
+CORS_ALLOW_HEADERS = tuple(
+    env.list(
+        "DJANGO_CORS_ALLOW_HEADERS",
+        default=[
+            "accept",
+            "accept-encoding",
+            "authorization",
+            "content-type",
+            "dnt",
+            "origin",
+            "user-agent",
+            "x-csrftoken",
+            "x-requested-with",
+        ],
+    ),
 )
 
-CORS_ALLOW_CREDENTIALS = env.bool("DJANGO_CORS_ALLOW_CREDENTIALS", default=False)
+CORS_ALLOW_CREDENTIALS = env_bool("DJANGO_CORS_ALLOW_CREDENTIALS", default=False)
 
 
 # ------------------------------------------------------------------------------
@@ -127,7 +173,6 @@ CORS_ALLOW_CREDENTIALS = env.bool("DJANGO_CORS_ALLOW_CREDENTIALS", default=False
 # ------------------------------------------------------------------------------
 # Make sure you installed:
 # pip install django-storages[boto3] collectfasta
-INSTALLED_APPS += ["storages"]
 
 AWS_ACCESS_KEY_ID = env("DJANGO_AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = env("DJANGO_AWS_SECRET_ACCESS_KEY")
@@ -138,7 +183,7 @@ AWS_QUERYSTRING_AUTH = False
 AWS_S3_REGION_NAME = env("DJANGO_AWS_S3_REGION_NAME", default=None)
 AWS_S3_CUSTOM_DOMAIN = env("DJANGO_AWS_S3_CUSTOM_DOMAIN", default=None)
 
-aws_s3_domain = AWS_S3_CUSTOM_DOMAIN or f"{AWS_STORAGE_BUCKET_NAME}.s3.amazonaws.com"
+aws_s3_domain = sys.intern(AWS_S3_CUSTOM_DOMAIN or f"{AWS_STORAGE_BUCKET_NAME}.s3.amazonaws.com")
 
 _AWS_EXPIRY = 60 * 60 * 24 * 7  # 7 days
 
@@ -160,11 +205,15 @@ STORAGES = {
     },
 }
 
-MEDIA_URL = f"https://{aws_s3_domain}/media/"
-STATIC_URL = f"https://{aws_s3_domain}/static/"
+MEDIA_URL = sys.intern(f"https://{aws_s3_domain}/media/")
+STATIC_URL = sys.intern(f"https://{aws_s3_domain}/static/")
 
+# The S3 backends above are imported from their dotted paths on first use and
+# don't need their apps installed. Only collectstatic needs them registered
+# (collectfasta overrides the command), so web/worker processes skip both.
 # collectfasta (optional; speeds collectstatic with S3)
-INSTALLED_APPS = ["collectfasta", *INSTALLED_APPS]
+if "collectstatic" in sys.argv:
+    INSTALLED_APPS = ("collectfasta", *INSTALLED_APPS, "storages")
 COLLECTFASTA_STRATEGY = "collectfasta.strategies.boto3.Boto3Strategy"
 
 
@@ -186,12 +235,12 @@ EMAIL_HOST = env("DJANGO_EMAIL_HOST", default="")
 EMAIL_PORT = env.int("DJANGO_EMAIL_PORT", default=587)
 EMAIL_HOST_USER = env("DJANGO_EMAIL_HOST_USER", default="")
 EMAIL_HOST_PASSWORD = env("DJANGO_EMAIL_HOST_PASSWORD", default="")
-EMAIL_USE_TLS = env.bool("DJANGO_EMAIL_USE_TLS", default=True)
+EMAIL_USE_TLS = env_bool("DJANGO_EMAIL_USE_TLS", default=True)
 EMAIL_TIMEOUT = env.int("DJANGO_EMAIL_TIMEOUT", default=10)
 
 # Optional: Anymail (only if you use it)
-if env.bool("DJANGO_USE_ANYMAIL", default=False):
-    INSTALLED_APPS += ["anymail"]
+if env_bool("DJANGO_USE_ANYMAIL", default=False):
+    INSTALLED_APPS += ("anymail",)
     ANYMAIL = {}  # configure provider keys in env
 
 
@@ -204,6 +253,18 @@ ADMIN_URL = env("DJANGO_ADMIN_URL", default="admin/")
 # ------------------------------------------------------------------------------
 # LOGGING (production safe)
 # ------------------------------------------------------------------------------
+# mail_admins is wired up when mail can actually go out: an SMTP host, Anymail,
+# or any non-SMTP EMAIL_BACKEND. Override with DJANGO_MAIL_ADMINS.
+MAIL_ADMINS = env_bool(
+    "DJANGO_MAIL_ADMINS",
+    default=(
+        bool(EMAIL_HOST)
+        or "anymail" in INSTALLED_APPS
+        or EMAIL_BACKEND != "django.core.mail.backends.smtp.EmailBackend"
+    ),
+)
+_admin_handlers = ["mail_admins"] if MAIL_ADMINS else []
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -219,18 +280,19 @@ LOGGING = {
             "class": "logging.StreamHandler",
             "formatter": "verbose",
         },
-        "mail_admins": {
-            "level": "ERROR",
-            "filters": ["require_debug_false"],
-            "class": "django.utils.log.AdminEmailHandler",
-        },
     },
     "root": {"level": "INFO", "handlers": ["console"]},
     "loggers": {
-        "django.request": {"handlers": ["mail_admins"], "level": "ERROR", "propagate": True},
-        "django.security.DisallowedHost": {"handlers": ["console", "mail_admins"], "level": "ERROR", "propagate": True},
+        "django.request": {"handlers": _admin_handlers, "level": "ERROR", "propagate": True},
+        "django.security.DisallowedHost": {"handlers": ["console", *_admin_handlers], "level": "ERROR", "propagate": True},
     },
 }
+if MAIL_ADMINS:
+    LOGGING["handlers"]["mail_admins"] = {
+        "level": "ERROR",
+        "filters": ["require_debug_false"],
+        "class": "django.utils.log.AdminEmailHandler",
+    }
 
 
 # ------------------------------------------------------------------------------
@@ -0,0 +1,12 @@
+"""
+Gunicorn configuration, picked up automatically when gunicorn is started from
+the project root (e.g. `gunicorn config.wsgi`).
+
+preload_app imports settings and the Django application once in the master,
+so forked workers share those pages copy-on-write instead of each re-running
+config/settings/*. Connections are opened lazily per worker, so nothing
+connection-bound is created before the fork. The worker count comes from
+WEB_CONCURRENCY, which gunicorn reads on its own.
+"""
+
+preload_app = True
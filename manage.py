@@ -4,10 +4,16 @@ import os
 import sys
 from pathlib import Path
 
+# Commands that never touch the web-only apps (see _WEB_ONLY_APPS in
+# config/settings/base.py); they start faster without them.
+LIGHT_COMMANDS = {"help", "makemigrations"}
+
 
 def main():
     """Run administrative tasks."""
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.local")
+    if len(sys.argv) < 2 or sys.argv[1] in LIGHT_COMMANDS:  # noqa: PLR2004
+        os.environ.setdefault("DJANGO_FULL_APPS", "0")
 
     try:
         from django.core.management import execute_from_command_line  # noqa: PLC0415